@@ -1,9 +1,16 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import json
+import numpy as np
+import plotly.graph_objects as go
+import os
+import pathlib
 from datetime import datetime
 
+# Computed once per process; the trend window and footer don't need
+# sub-second freshness
+_CURRENT_YEAR = datetime.now().year
+_FOOTER_DATE = datetime.now().strftime("%B %Y")
+
 # Set page configuration
 st.set_page_config(
     page_title="Data Breach Dashboard",
@@ -12,194 +19,45 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling and professional look
-st.markdown("""
-<style>
-    /* Main layout and typography */
-    .main-header {
-        font-size: 2.8rem;
-        font-weight: 700;
-        color: #2c3e50;
-        text-align: center;
-        margin-bottom: 1.5rem;
-        padding-bottom: 1rem;
-        border-bottom: 2px solid #ecf0f1;
-    }
-    .sub-header {
-        font-size: 1.8rem;
-        font-weight: 600;
-        color: #3498db;
-        margin-bottom: 1rem;
-        padding-bottom: 0.5rem;
-        border-bottom: 1px solid #ecf0f1;
-    }
-    
-    /* Cards styling */
-    .card {
-        border-radius: 8px;
-        padding: 1.2rem;
-        margin-bottom: 1.5rem;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        transition: transform 0.2s, box-shadow 0.2s;
-        background-color: white;
-        overflow: hidden;
-        width: 100%;
-        display: block;
-        position: relative;
-        color: #2c3e50;
-    }
-    .card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 6px 12px rgba(0, 0, 0, 0.15);
-    }
-    .metric-card {
-        background-color: white;
-        border-left: 5px solid #3498db;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-        align-items: center;
-        text-align: center;
-        height: 100%;
-        color: #2c3e50;
-    }
-    .insight-card {
-        background-color: white;
-        border-left: 5px solid #e74c3c;
-        display: flex;
-        flex-direction: column;
-        justify-content: flex-start;
-        padding: 1.5rem;
-        height: 100%;
-        width: 100%;
-        color: #2c3e50;
-    }
-    
-    .insight-card .content {
-        width: 100%;
-    }
-    
-    .insight-card h3 {
-        color: #e74c3c;
-        font-size: 1.4rem;
-        margin-bottom: 1rem;
-        border-bottom: 1px solid #ecf0f1;
-        padding-bottom: 0.5rem;
-    }
-    
-    .insight-card ul {
-        margin-bottom: 1.5rem;
-        padding-left: 1.2rem;
-    }
-    
-    .insight-card li {
-        margin-bottom: 0.7rem;
-        line-height: 1.5;
-    }
-    
-    .insight-card strong {
-        color: #2980b9;
-    }
-    
-    /* Metrics styling */
-    .metric-value {
-        font-size: 2.2rem;
-        font-weight: 700;
-        color: #2c3e50;
-    }
-    .metric-label {
-        font-size: 1rem;
-        color: #7f8c8d;
-        text-transform: uppercase;
-    }
-    
-    /* Filter section styling */
-    .sidebar .stSelectbox, .sidebar .stMultiselect {
-        background-color: #f8f9fa;
-        border-radius: 6px;
-        padding: 0.5rem;
-        margin-bottom: 1rem;
-    }
-    
-    /* Footer styling */
-    .footer {
-        text-align: center;
-        color: #7f8c8d;
-        padding: 1.5rem 0;
-        margin-top: 2rem;
-        border-top: 1px solid #ecf0f1;
-        font-size: 0.9rem;
-    }
-    
-    /* Responsive adjustments */
-    @media (max-width: 768px) {
-        .main-header {
-            font-size: 2rem;
-        }
-        .sub-header {
-            font-size: 1.5rem;
-        }
-        .metric-value {
-            font-size: 1.8rem;
-        }
-    }
-    
-    /* Fix for white text and input bars */
-    .stMarkdown, .stText {
-        color: #2c3e50;
-    }
-    
-    .stTextInput > div > div > input {
-        background-color: #f0f2f6;
-        border: 1px solid #dfe1e6;
-        border-radius: 4px;
-    }
-    
-    /* Dashboard metrics container */
-    .dashboard-metrics {
-        margin-bottom: 2rem;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# Load data
-@st.cache_data
-def load_data():
-    with open('breaches.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    df = pd.json_normalize(data)
-    
-    # Convert date columns to datetime
-    df['BreachDate'] = pd.to_datetime(df['BreachDate'])
-    df['AddedDate'] = pd.to_datetime(df['AddedDate'])
-    df['ModifiedDate'] = pd.to_datetime(df['ModifiedDate'])
-    
-    # Extract year and month for timeline analysis
-    df['BreachYear'] = df['BreachDate'].dt.year
-    df['BreachMonth'] = df['BreachDate'].dt.month
-    df['BreachYearMonth'] = df['BreachDate'].dt.strftime('%Y-%m')
-    
-    # Create a column for breach size category
-    df['BreachSizeCategory'] = pd.cut(
-        df['PwnCount'],
-        bins=[0, 10000, 1000000, 50000000, float('inf')],
-        labels=['Small (<10k)', 'Medium (10k-1M)', 'Large (1M-50M)', 'Massive (>50M)']
-    ).astype(str)  # Convert to string type immediately after creation
-    
-    # Explode the DataClasses column to analyze data types
-    data_classes_df = df.explode('DataClasses')
-    
-    return df, data_classes_df
+# Custom CSS for better styling and professional look, kept in a static
+# file so the rerun path only re-sends a cached string
+@st.cache_data(show_spinner=False)
+def _load_css():
+    return pathlib.Path('static/style.css').read_text()
+
+st.markdown(f'<style>{_load_css()}</style>', unsafe_allow_html=True)
+
+# Load data (preprocessed by preprocess_data.py; derived columns are
+# already materialized with proper dtypes)
+@st.cache_data(show_spinner=False)
+def _load_main():
+    return pd.read_parquet('breaches.parquet', engine='pyarrow', use_threads=True)
+
+# The exploded frame only carries the two columns used downstream (Name,
+# DataClasses), both categorical, so value_counts runs on integer codes
+@st.cache_data(show_spinner=False)
+def _load_exploded():
+    return pd.read_parquet('breaches_exploded.parquet', engine='pyarrow', use_threads=True)
 
 # Load the data
-df, data_classes_df = load_data()
+df = _load_main()
+data_classes_df = _load_exploded()
+
+# Sidebar option lists, memoized so reruns skip the column scans; keyed
+# on the Parquet mtime so they refresh when the data is regenerated
+@st.cache_data(show_spinner=False)
+def _sidebar_options(data_mtime):
+    size_options = df['BreachSizeCategory'].cat.categories.tolist()
+    min_date = df['BreachDate'].min().date()
+    max_date = df['BreachDate'].max().date()
+    return size_options, min_date, max_date
+
+size_options, min_date, max_date = _sidebar_options(os.path.getmtime('breaches.parquet'))
 
 # Sidebar filters
 st.sidebar.title("Dashboard Filters")
 
 # Date range filter
-min_date = df['BreachDate'].min().date()
-max_date = df['BreachDate'].max().date()
 date_range = st.sidebar.date_input(
     "Breach Date Range",
     [min_date, max_date],
@@ -207,13 +65,6 @@ date_range = st.sidebar.date_input(
     max_value=max_date
 )
 
-if len(date_range) == 2:
-    start_date, end_date = date_range
-    filtered_df = df[(df['BreachDate'].dt.date >= start_date) & 
-                    (df['BreachDate'].dt.date <= end_date)]
-else:
-    filtered_df = df
-
 # Verification status filter
 verification_status = st.sidebar.multiselect(
     "Verification Status",
@@ -221,14 +72,6 @@ verification_status = st.sidebar.multiselect(
     default=["Verified", "Unverified"]
 )
 
-if verification_status:
-    if "Verified" in verification_status and "Unverified" in verification_status:
-        pass  # Keep all records
-    elif "Verified" in verification_status:
-        filtered_df = filtered_df[filtered_df['IsVerified'] == True]
-    elif "Unverified" in verification_status:
-        filtered_df = filtered_df[filtered_df['IsVerified'] == False]
-
 # Sensitivity filter
 sensitivity_status = st.sidebar.multiselect(
     "Sensitivity Status",
@@ -236,26 +79,179 @@ sensitivity_status = st.sidebar.multiselect(
     default=["Sensitive", "Non-Sensitive"]
 )
 
-if sensitivity_status:
-    if "Sensitive" in sensitivity_status and "Non-Sensitive" in sensitivity_status:
-        pass  # Keep all records
-    elif "Sensitive" in sensitivity_status:
-        filtered_df = filtered_df[filtered_df['IsSensitive'] == True]
-    elif "Non-Sensitive" in sensitivity_status:
-        filtered_df = filtered_df[filtered_df['IsSensitive'] == False]
-
 # Breach size filter
 breach_size = st.sidebar.multiselect(
     "Breach Size",
-    options=df['BreachSizeCategory'].dropna().unique().tolist(),
-    default=df['BreachSizeCategory'].dropna().unique().tolist()
+    options=size_options,
+    default=size_options
 )
 
-if breach_size:
-    filtered_df = filtered_df[filtered_df['BreachSizeCategory'].isin(breach_size)]
+# Build each figure once and only rebind its data arrays per filter
+# state; the stable key= on st.plotly_chart lets the frontend diff the
+# existing plot instead of drawing a new one
+@st.cache_resource
+def _base_data_classes_fig():
+    fig = go.Figure(go.Bar(
+        x=[],
+        y=[],  # Labels that include the percentage
+        orientation='h',
+        marker=dict(colorscale='Reds'),
+        text=[],  # Display the count on the bars
+        textposition='outside'
+    ))
+    fig.update_layout(
+        title='Top 10 Compromised Data Classes',
+        yaxis={'categoryorder': 'total ascending', 'title': 'Data Class'},
+        xaxis_title='Number of Breaches',
+        margin=dict(l=10, r=10, t=40, b=10),
+        plot_bgcolor='rgba(0,0,0,0)',
+        height=500  # Increase height for better readability
+    )
+    return fig
+
+@st.cache_resource
+def _base_top_breaches_fig():
+    fig = go.Figure(go.Bar(
+        x=[],
+        y=[],
+        marker=dict(colorscale='Blues'),
+        hovertemplate=('Breach Name=%{x}<br>Users Affected=%{y}'
+                       '<br>Domain=%{customdata[0]}<br>BreachDate=%{customdata[1]}'
+                       '<br>IsVerified=%{customdata[2]}<br>IsSensitive=%{customdata[3]}'
+                       '<extra></extra>')
+    ))
+    fig.update_layout(
+        title='Top 10 Breaches by Users Affected',
+        xaxis_title='Breach Name',
+        yaxis_title='Users Affected'
+    )
+    return fig
+
+# The whole filter/aggregate/figure pipeline is memoized on the sidebar
+# selection, so a rerun with an unchanged filter state is a cache lookup
+@st.cache_data(show_spinner=False)
+def compute_dashboard(date_range, verification_status, sensitivity_status, breach_size):
+    # Build a single boolean mask across all filters and slice once at
+    # the end, instead of copying the frame after every filter step
+    mask = np.ones(len(df), dtype=bool)
+
+    if len(date_range) == 2:
+        start_date, end_date = date_range
+        # Compare on the raw datetime64 values to stay on the NumPy fast path
+        breach_dates = df['BreachDate'].values
+        mask &= (breach_dates >= np.datetime64(start_date)) & \
+                (breach_dates <= np.datetime64(end_date))
+
+    # Each flag filter collapses to a tri-state int: 1 = positive option
+    # only, 2 = negative option only, 0 or 3 = no filtering needed
+    verification_state = (("Verified" in verification_status)
+                          | (("Unverified" in verification_status) << 1))
+    if verification_state == 1:
+        mask &= df['IsVerified'].values
+    elif verification_state == 2:
+        mask &= ~df['IsVerified'].values
+
+    sensitivity_state = (("Sensitive" in sensitivity_status)
+                         | (("Non-Sensitive" in sensitivity_status) << 1))
+    if sensitivity_state == 1:
+        mask &= df['IsSensitive'].values
+    elif sensitivity_state == 2:
+        mask &= ~df['IsSensitive'].values
+
+    if breach_size:
+        # Filter on the int8 category codes rather than hashing label strings
+        size_categories = df['BreachSizeCategory'].cat.categories
+        wanted_codes = np.array([size_categories.get_loc(size) for size in breach_size],
+                                dtype=np.int8)
+        mask &= np.isin(df['BreachSizeCategory'].cat.codes.values, wanted_codes)
+
+    # Apply all filters with a single slice
+    filtered_df = df.loc[mask]
+
+    # Create a filtered version of data_classes_df based on the current
+    # filtered_df, matching breaches through a boolean lookup over the
+    # shared Name category codes rather than hashing name strings
+    name_selected = np.zeros(len(df['Name'].cat.categories), dtype=bool)
+    name_selected[filtered_df['Name'].cat.codes.values] = True
+    filtered_data_classes_df = \
+        data_classes_df[name_selected[data_classes_df['Name'].cat.codes.values]]
+
+    # Count data classes with a bincount over the int8/int16 category
+    # codes instead of value_counts on the label column
+    dc_categories = data_classes_df['DataClasses'].cat.categories
+    dc_codes = filtered_data_classes_df['DataClasses'].cat.codes.values
+    class_counts = np.bincount(dc_codes[dc_codes >= 0], minlength=len(dc_categories))
+    observed = np.flatnonzero(class_counts)
+    order = observed[np.argsort(-class_counts[observed], kind='stable')]
+    # Only the top 10 classes ever reach a DataFrame; the chart frame is
+    # built straight from the counts array, percentages included
+    top_codes = order[:10]
+    top_counts = class_counts[top_codes]
+    top_data_classes = pd.DataFrame({
+        'DataClass': dc_categories[top_codes],
+        'Count': top_counts,
+        'Percentage': np.round(top_counts / top_counts.sum() * 100, 1),
+    })
+
+    # Select the top 10 breaches with one O(n) partial sort instead of
+    # separate idxmax/max/nlargest passes over PwnCount
+    pwn_counts = filtered_df['PwnCount'].values
+    top_k = min(10, len(pwn_counts))
+    top_idx = np.argpartition(-pwn_counts, top_k - 1)[:top_k]
+    top_breaches = filtered_df.iloc[top_idx].sort_values('PwnCount', ascending=False)
+
+    # Calculate trend from the year array directly; no need to
+    # materialize DataFrames just to take their lengths
+    breach_years = filtered_df['BreachYear'].values
+    recent_count = int(np.count_nonzero(breach_years >= _CURRENT_YEAR - 2))
+    previous_count = int(np.count_nonzero((breach_years < _CURRENT_YEAR - 2) &
+                                          (breach_years >= _CURRENT_YEAR - 4)))
+
+    # Create labels with percentages via vectorized string concat
+    top_data_classes['Label'] = (top_data_classes['DataClass'].astype(str) + ' ('
+                                 + top_data_classes['Percentage'].astype(str) + '%)')
+
+    # Sort by count in descending order for better visualization
+    top_data_classes = top_data_classes.sort_values('Count', ascending=True)
+
+    fig_data_classes = _base_data_classes_fig()
+    fig_data_classes.data[0].x = top_data_classes['Count'].values
+    fig_data_classes.data[0].y = top_data_classes['Label'].values
+    fig_data_classes.data[0].text = top_data_classes['Count'].values
+    fig_data_classes.data[0].marker.color = top_data_classes['Count'].values
+
+    fig_top_breaches = _base_top_breaches_fig()
+    fig_top_breaches.data[0].x = top_breaches['Name'].values
+    fig_top_breaches.data[0].y = top_breaches['PwnCount'].values
+    fig_top_breaches.data[0].marker.color = top_breaches['PwnCount'].values
+    fig_top_breaches.data[0].customdata = \
+        top_breaches[['Domain', 'BreachDate', 'IsVerified', 'IsSensitive']].values
+
+    total_breaches = len(filtered_df)
+    verified_count = int(np.count_nonzero(filtered_df['IsVerified'].values))
+    sensitive_count = int(np.count_nonzero(filtered_df['IsSensitive'].values))
+    insights = {
+        'total_breaches': total_breaches,
+        'total_pwned': int(filtered_df['PwnCount'].values.sum()),
+        'verified_count': verified_count,
+        'verified_percentage': (verified_count / total_breaches) * 100 if total_breaches > 0 else 0,
+        'sensitive_count': sensitive_count,
+        'sensitive_percentage': (sensitive_count / total_breaches) * 100 if total_breaches > 0 else 0,
+        'most_common_data_class': dc_categories[order[0]],
+        'largest_breach': top_breaches.iloc[0]['Name'],
+        'largest_breach_count': top_breaches.iloc[0]['PwnCount'],
+        'recent_count': recent_count,
+        'previous_count': previous_count,
+        'trend_text': 'increasing' if recent_count > previous_count else 'decreasing',
+    }
+    return fig_data_classes, fig_top_breaches, insights
 
-# Create a filtered version of data_classes_df based on the current filtered_df
-filtered_data_classes_df = data_classes_df[data_classes_df['Name'].isin(filtered_df['Name'])]
+fig_data_classes, fig_top_breaches, insights = compute_dashboard(
+    tuple(date_range),
+    tuple(verification_status),
+    tuple(sensitivity_status),
+    tuple(breach_size)
+)
 
 # Main dashboard
 st.markdown('<h1 class="main-header">Data Breach Dashboard</h1>', unsafe_allow_html=True)
@@ -265,39 +261,33 @@ st.markdown('<div class="dashboard-metrics">', unsafe_allow_html=True)
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
-    total_breaches = len(filtered_df)
     st.markdown(f'''
         <div class="card metric-card">
-            <div class="metric-value">{total_breaches:,}</div>
+            <div class="metric-value">{insights['total_breaches']:,}</div>
             <div class="metric-label">Total Breaches</div>
         </div>
     ''', unsafe_allow_html=True)
 
 with col2:
-    total_pwned = filtered_df['PwnCount'].sum()
     st.markdown(f'''
         <div class="card metric-card">
-            <div class="metric-value">{total_pwned:,}</div>
+            <div class="metric-value">{insights['total_pwned']:,}</div>
             <div class="metric-label">Total Affected Users</div>
         </div>
     ''', unsafe_allow_html=True)
 
 with col3:
-    verified_count = filtered_df['IsVerified'].sum()
-    verified_percentage = (verified_count / len(filtered_df)) * 100 if len(filtered_df) > 0 else 0
     st.markdown(f'''
         <div class="card metric-card">
-            <div class="metric-value">{verified_count:,} ({verified_percentage:.1f}%)</div>
+            <div class="metric-value">{insights['verified_count']:,} ({insights['verified_percentage']:.1f}%)</div>
             <div class="metric-label">Verified Breaches</div>
         </div>
     ''', unsafe_allow_html=True)
 
 with col4:
-    sensitive_count = filtered_df['IsSensitive'].sum()
-    sensitive_percentage = (sensitive_count / len(filtered_df)) * 100 if len(filtered_df) > 0 else 0
     st.markdown(f'''
         <div class="card metric-card">
-            <div class="metric-value">{sensitive_count:,} ({sensitive_percentage:.1f}%)</div>
+            <div class="metric-value">{insights['sensitive_count']:,} ({insights['sensitive_percentage']:.1f}%)</div>
             <div class="metric-label">Sensitive Breaches</div>
         </div>
     ''', unsafe_allow_html=True)
@@ -306,78 +296,11 @@ st.markdown('</div>', unsafe_allow_html=True)
 
 # Most Common Data Classes Breached
 st.markdown('<h2 class="sub-header">Most Common Data Classes Breached</h2>', unsafe_allow_html=True)
-
-data_class_counts = filtered_data_classes_df['DataClasses'].value_counts().reset_index()
-data_class_counts.columns = ['DataClass', 'Count']
-top_data_classes = data_class_counts.head(10)
-
-# Calculate percentage of breaches for each data class
-top_data_classes = top_data_classes.copy()  # Create a copy to avoid SettingWithCopyWarning
-top_data_classes.loc[:, 'Percentage'] = (top_data_classes['Count'] / top_data_classes['Count'].sum() * 100).round(1)
-
-# Get the most common data class for insights
-most_common_data_class = data_class_counts.iloc[0]['DataClass']
-
-# Calculate other variables for insights
-largest_breach = filtered_df.loc[filtered_df['PwnCount'].idxmax(), 'Name']
-largest_breach_count = filtered_df['PwnCount'].max()
-
-# Calculate trend
-current_year = datetime.now().year
-recent_breaches = filtered_df[filtered_df['BreachYear'] >= (current_year - 2)]
-previous_breaches = filtered_df[(filtered_df['BreachYear'] < (current_year - 2)) & 
-                               (filtered_df['BreachYear'] >= (current_year - 4))]
-recent_count = len(recent_breaches)
-previous_count = len(previous_breaches)
-trend_text = 'increasing' if recent_count > previous_count else 'decreasing'
-
-# Create labels with percentages - Fix for the TypeError
-top_data_classes['Label'] = top_data_classes.apply(
-    lambda row: f"{row['DataClass']} ({row['Percentage']}%)", axis=1
-)
-
-# Sort by count in descending order for better visualization
-top_data_classes = top_data_classes.sort_values('Count', ascending=True)
-
-fig_data_classes = px.bar(
-    top_data_classes,
-    x='Count',
-    y='Label',  # Use the new label that includes percentage
-    orientation='h',
-    title='Top 10 Compromised Data Classes',
-    color='Count',
-    color_continuous_scale='Reds',
-    labels={'Count': 'Number of Breaches', 'Label': 'Data Class'},
-    text='Count'  # Display the count on the bars
-)
-
-# Improve the layout
-fig_data_classes.update_traces(textposition='outside')
-fig_data_classes.update_layout(
-    yaxis={'categoryorder':'total ascending'},
-    xaxis_title='Number of Breaches',
-    margin=dict(l=10, r=10, t=40, b=10),
-    plot_bgcolor='rgba(0,0,0,0)',
-    height=500  # Increase height for better readability
-)
-st.plotly_chart(fig_data_classes, use_container_width=True)
+st.plotly_chart(fig_data_classes, use_container_width=True, key='fig_data_classes')
 
 # Most Significant Breaches
 st.markdown('<h2 class="sub-header">Most Significant Breaches</h2>', unsafe_allow_html=True)
-
-top_breaches = filtered_df.nlargest(10, 'PwnCount')
-
-fig_top_breaches = px.bar(
-    top_breaches,
-    x='Name',
-    y='PwnCount',
-    title='Top 10 Breaches by Users Affected',
-    color='PwnCount',
-    color_continuous_scale='Blues',
-    hover_data=['Domain', 'BreachDate', 'IsVerified', 'IsSensitive'],
-    labels={'PwnCount': 'Users Affected', 'Name': 'Breach Name'}
-)
-st.plotly_chart(fig_top_breaches, use_container_width=True)
+st.plotly_chart(fig_top_breaches, use_container_width=True, key='fig_top_breaches')
 
 # Actionable Insights & Recommendations
 st.markdown('<h2 class="sub-header">Actionable Insights & Recommendations</h2>', unsafe_allow_html=True)
@@ -389,13 +312,13 @@ st.markdown(
         <div class="content">
             <h3>Key Data Breach Insights</h3>
             <ul>
-                <li><b>Most Common Data Type:</b> {most_common_data_class}</li>
-                <li><b>Largest Breach:</b> {largest_breach} affecting {largest_breach_count:,} users</li>
-                <li><b>Recent Trend:</b> Data breaches are {trend_text} compared to previous years ({recent_count} breaches in the last 2 years vs {previous_count} in the 2 years before that)</li>
+                <li><b>Most Common Data Type:</b> {insights['most_common_data_class']}</li>
+                <li><b>Largest Breach:</b> {insights['largest_breach']} affecting {insights['largest_breach_count']:,} users</li>
+                <li><b>Recent Trend:</b> Data breaches are {insights['trend_text']} compared to previous years ({insights['recent_count']} breaches in the last 2 years vs {insights['previous_count']} in the 2 years before that)</li>
             </ul>
             <h3>Recommendations</h3>
             <ul>
-                <li><b>Focus security training</b> on protecting {most_common_data_class} data</li>
+                <li><b>Focus security training</b> on protecting {insights['most_common_data_class']} data</li>
                 <li><b>Implement stronger authentication mechanisms</b> to prevent unauthorized access</li>
                 <li><b>Regularly audit and update</b> data protection policies</li>
                 <li><b>Consider implementing data minimization strategies</b> to reduce breach impact</li>
@@ -408,4 +331,4 @@ st.markdown(
 
 
 # Add footer
-st.markdown('<div class="footer">Data Breach Dashboard | Updated: ' + datetime.now().strftime("%B %Y") + '</div>', unsafe_allow_html=True)
\ No newline at end of file
+st.markdown('<div class="footer">Data Breach Dashboard | Updated: ' + _FOOTER_DATE + '</div>', unsafe_allow_html=True)
@@ -1,11 +1,13 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 import json
+import os
 from datetime import datetime
-import matplotlib.pyplot as plt
-import altair as alt
+
+import preprocess_data
 
 # Set page configuration
 st.set_page_config(
@@ -15,8 +17,11 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling and professional look
-st.markdown("""
+# Custom CSS for better styling and professional look. Kept as one
+# module-level constant so each rerun sends a single precomputed
+# markdown message; it must be re-emitted every run because Streamlit
+# drops elements that are not part of the current script run
+CSS_BLOCK = """
 <style>
     /* Main layout and typography */
     .main-header {
@@ -101,39 +106,164 @@ st.markdown("""
         }
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(CSS_BLOCK, unsafe_allow_html=True)
 
 # Load data
 @st.cache_data
 def load_data():
-    with open('breaches.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    df = pd.json_normalize(data)
-    
-    # Convert date columns to datetime
-    df['BreachDate'] = pd.to_datetime(df['BreachDate'])
-    df['AddedDate'] = pd.to_datetime(df['AddedDate'])
-    df['ModifiedDate'] = pd.to_datetime(df['ModifiedDate'])
-    
-    # Extract year and month for timeline analysis
-    df['BreachYear'] = df['BreachDate'].dt.year
-    df['BreachMonth'] = df['BreachDate'].dt.month
-    df['BreachYearMonth'] = df['BreachDate'].dt.strftime('%Y-%m')
-    
-    # Create a column for breach size category
-    df['BreachSizeCategory'] = pd.cut(
-        df['PwnCount'],
-        bins=[0, 10000, 1000000, 50000000, float('inf')],
-        labels=['Small (<10k)', 'Medium (10k-1M)', 'Large (1M-50M)', 'Massive (>50M)']
-    )
-    
-    # Explode the DataClasses column to analyze data types
-    data_classes_df = df.explode('DataClasses')
-    
-    return df, data_classes_df
+    # Prefer the preprocessed Parquet files and fall back to rebuilding
+    # them only when breaches.json is newer (see preprocess_data.py)
+    if not (os.path.exists('breaches.parquet')
+            and os.path.getmtime('breaches.parquet') >= os.path.getmtime('breaches.json')):
+        preprocess_data.write_frames(*preprocess_data.build_frames())
+    df = pd.read_parquet('breaches.parquet', engine='pyarrow')
+    data_classes_df = pd.read_parquet('breaches_exploded.parquet', engine='pyarrow')
+
+    # CSR-style breach -> data class index: flat_codes holds every
+    # breach's class codes in row order and offsets[i]:offsets[i+1]
+    # delimits breach i's slice, so membership tests run on int32 codes
+    dataclass_vocab = pd.Index(pd.unique(data_classes_df['DataClasses']))
+    flat_codes = dataclass_vocab.get_indexer(data_classes_df['DataClasses'].values).astype(np.int32)
+    offsets = np.concatenate(([0], np.cumsum(df['DataClasses'].str.len().values)))
+
+    # Dense month codes for the timeline: 0 for the earliest breach month
+    # through M-1 for the latest, so per-filter monthly aggregates reduce
+    # to a bincount instead of a groupby plus datetime parsing
+    month_i8 = df['BreachDate'].values.astype('datetime64[M]').view('i8')
+    month_start = month_i8.min()
+    df['MonthCode'] = (month_i8 - month_start).astype(np.int32)
+    month_axis = ((np.arange(month_i8.max() - month_start + 1) + month_start)
+                  .view('datetime64[M]').astype('datetime64[ns]'))
+
+    # Sidebar option lists, computed once here instead of scanning the
+    # columns on every rerun
+    size_categories = list(df['BreachSizeCategory'].cat.categories)
+    all_data_classes = sorted(dataclass_vocab)
+
+    return (df, data_classes_df, flat_codes, offsets, dataclass_vocab,
+            month_axis, size_categories, all_data_classes)
 
 # Load the data
-df, data_classes_df = load_data()
+(df, data_classes_df, dc_flat_codes, dc_offsets, dataclass_vocab,
+ month_axis, size_categories, all_data_classes) = load_data()
+
+# Define high-risk data classes (they drive the severity score)
+high_risk_classes = [
+    'Passwords', 'Credit cards', 'Social security numbers', 'Financial data',
+    'Health records', 'Dates of birth', 'Phone numbers', 'Security questions and answers'
+]
+
+# Resolve the high-risk classes to a boolean lookup over the data class
+# vocabulary and count each breach's high-risk classes with a single
+# reduceat over the CSR index; severity scoring just indexes into this
+high_risk_per_breach = np.add.reduceat(
+    dataclass_vocab.isin(high_risk_classes)[dc_flat_codes].astype(np.int8),
+    dc_offsets[:-1]).astype(np.int64)
+high_risk_per_breach[np.diff(dc_offsets) == 0] = 0
+
+# Base chart templates, built once per process with st.cache_resource.
+# Plotly Express re-derives hover templates, color scales and axis
+# configs on every call, so reruns only re-bind the data arrays onto
+# these figures instead of rebuilding them from scratch
+@st.cache_resource
+def _base_data_classes_fig(title):
+    fig = go.Figure(go.Bar(
+        x=[],
+        y=[],  # Labels that include the percentage
+        orientation='h',
+        marker=dict(colorscale='Reds'),
+        text=[],  # Display the count on the bars
+        textposition='outside'
+    ))
+    fig.update_layout(
+        title=title,
+        yaxis={'categoryorder': 'total ascending', 'title': 'Data Class'},
+        xaxis_title='Number of Breaches',
+        margin=dict(l=10, r=10, t=40, b=10),
+        plot_bgcolor='rgba(0,0,0,0)',
+        height=500  # Increase height for better readability
+    )
+    return fig
+
+@st.cache_resource
+def _base_timeline_fig(title, y_title, line_color):
+    fig = go.Figure(go.Scatter(x=[], y=[], mode='lines',
+                               line=dict(color=line_color)))
+    fig.update_layout(title=title, xaxis_title='Date', yaxis_title=y_title)
+    return fig
+
+@st.cache_resource
+def _base_top_breaches_fig():
+    fig = go.Figure(go.Bar(
+        x=[],
+        y=[],
+        marker=dict(colorscale='Blues'),
+        hovertemplate=('Breach Name=%{x}<br>Users Affected=%{y}'
+                       '<br>Domain=%{customdata[0]}<br>BreachDate=%{customdata[1]}'
+                       '<br>IsVerified=%{customdata[2]}<br>IsSensitive=%{customdata[3]}'
+                       '<extra></extra>')
+    ))
+    fig.update_layout(
+        title='Top 10 Breaches by Users Affected',
+        xaxis_title='Breach Name',
+        yaxis_title='Users Affected'
+    )
+    return fig
+
+@st.cache_resource
+def _base_status_pie_fig(title):
+    fig = go.Figure(go.Pie(labels=[], values=[], marker=dict(colors=[])))
+    fig.update_layout(title=title)
+    return fig
+
+@st.cache_resource
+def _base_impact_bar_fig():
+    fig = go.Figure(go.Bar(x=[], y=[], marker=dict(color=[])))
+    fig.update_layout(
+        title='Average Users Affected by Verification Status',
+        xaxis_title='Verification Status',
+        yaxis_title='Average Users Affected'
+    )
+    return fig
+
+@st.cache_resource
+def _base_size_fig():
+    fig = go.Figure(go.Bar(
+        x=[],
+        y=[],
+        marker=dict(color=[]),
+        text=[],
+        texttemplate='%{text}%',
+        textposition='outside'
+    ))
+    fig.update_layout(
+        title='Distribution of Breaches by Size',
+        xaxis_title='Breach Size',
+        yaxis_title='Number of Breaches',
+        uniformtext_minsize=10,
+        uniformtext_mode='hide',
+        margin=dict(l=10, r=10, t=40, b=10),
+        plot_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig
+
+@st.cache_resource
+def _base_severity_fig():
+    fig = go.Figure(go.Pie(
+        labels=[],
+        values=[],
+        marker=dict(colors=[]),
+        hole=0.4,
+        textposition='inside',
+        textinfo='percent+label'
+    ))
+    fig.update_layout(
+        title='Distribution of Breach Severity',
+        margin=dict(l=10, r=10, t=40, b=10),
+        legend=dict(orientation='h', yanchor='bottom', y=-0.2, xanchor='center', x=0.5)
+    )
+    return fig
 
 # Sidebar filters
 st.sidebar.title("Dashboard Filters")
@@ -148,13 +278,6 @@ date_range = st.sidebar.date_input(
     max_value=max_date
 )
 
-if len(date_range) == 2:
-    start_date, end_date = date_range
-    filtered_df = df[(df['BreachDate'].dt.date >= start_date) & 
-                    (df['BreachDate'].dt.date <= end_date)]
-else:
-    filtered_df = df
-
 # Verification status filter
 verification_status = st.sidebar.multiselect(
     "Verification Status",
@@ -162,14 +285,6 @@ verification_status = st.sidebar.multiselect(
     default=["Verified", "Unverified"]
 )
 
-if verification_status:
-    if "Verified" in verification_status and "Unverified" in verification_status:
-        pass  # Keep all records
-    elif "Verified" in verification_status:
-        filtered_df = filtered_df[filtered_df['IsVerified'] == True]
-    elif "Unverified" in verification_status:
-        filtered_df = filtered_df[filtered_df['IsVerified'] == False]
-
 # Sensitivity filter
 sensitivity_status = st.sidebar.multiselect(
     "Sensitivity Status",
@@ -177,39 +292,89 @@ sensitivity_status = st.sidebar.multiselect(
     default=["Sensitive", "Non-Sensitive"]
 )
 
-if sensitivity_status:
-    if "Sensitive" in sensitivity_status and "Non-Sensitive" in sensitivity_status:
-        pass  # Keep all records
-    elif "Sensitive" in sensitivity_status:
-        filtered_df = filtered_df[filtered_df['IsSensitive'] == True]
-    elif "Non-Sensitive" in sensitivity_status:
-        filtered_df = filtered_df[filtered_df['IsSensitive'] == False]
-
 # Breach size filter
 breach_size = st.sidebar.multiselect(
     "Breach Size",
-    options=df['BreachSizeCategory'].unique().tolist(),
-    default=df['BreachSizeCategory'].unique().tolist()
+    options=size_categories,
+    default=size_categories
 )
 
-if breach_size:
-    filtered_df = filtered_df[filtered_df['BreachSizeCategory'].isin(breach_size)]
-
 # Data class filter
-all_data_classes = data_classes_df['DataClasses'].unique().tolist()
 selected_data_classes = st.sidebar.multiselect(
     "Data Classes Compromised",
     options=all_data_classes,
     default=[]
 )
 
-if selected_data_classes:
-    # Filter to breaches that contain ANY of the selected data classes
-    filtered_data_classes_df = data_classes_df[data_classes_df['DataClasses'].isin(selected_data_classes)]
-    filtered_df = filtered_df[filtered_df['Name'].isin(filtered_data_classes_df['Name'])]
+# The whole sidebar selection reduces to one hashable tuple; the cached
+# transforms below are keyed on it, so reruns that repeat a filter state
+# skip the pandas work entirely
+filter_state = (
+    tuple(date_range),
+    tuple(verification_status),
+    tuple(sensitivity_status),
+    tuple(breach_size),
+    tuple(selected_data_classes),
+)
 
-# Create a filtered version of data_classes_df based on the current filtered_df
-filtered_data_classes_df = data_classes_df[data_classes_df['Name'].isin(filtered_df['Name'])]
+@st.cache_data(show_spinner=False)
+def compute_filtered(state):
+    date_range, verification_status, sensitivity_status, breach_size, \
+        selected_data_classes = state
+
+    # Assemble one compound expression and let numexpr evaluate it as a
+    # single tiled pass with one output buffer, instead of allocating a
+    # temporary boolean array per clause
+    expr_parts = []
+    local_dict = {}
+
+    if len(date_range) == 2:
+        start_date, end_date = date_range
+        # datetime64 bounds; the end bound covers the whole selected day
+        # so any intra-day timestamps stay included
+        local_dict['start_ns'] = np.datetime64(start_date, 'ns')
+        local_dict['end_ns'] = (np.datetime64(end_date, 'ns')
+                                + np.timedelta64(1, 'D') - np.timedelta64(1, 'ns'))
+        expr_parts.append('BreachDate >= @start_ns and BreachDate <= @end_ns')
+
+    if verification_status:
+        if "Verified" in verification_status and "Unverified" in verification_status:
+            pass  # Keep all records
+        elif "Verified" in verification_status:
+            expr_parts.append('IsVerified')
+        elif "Unverified" in verification_status:
+            expr_parts.append('not IsVerified')
+
+    if sensitivity_status:
+        if "Sensitive" in sensitivity_status and "Non-Sensitive" in sensitivity_status:
+            pass  # Keep all records
+        elif "Sensitive" in sensitivity_status:
+            expr_parts.append('IsSensitive')
+        elif "Non-Sensitive" in sensitivity_status:
+            expr_parts.append('not IsSensitive')
+
+    if breach_size:
+        local_dict['sizes'] = list(breach_size)
+        expr_parts.append('BreachSizeCategory in @sizes')
+
+    filtered_df = (df.query(' and '.join(expr_parts), engine='numexpr',
+                            local_dict=local_dict)
+                   if expr_parts else df)
+
+    if selected_data_classes:
+        # The data class filter stays outside the expression (membership
+        # in the exploded lists is not expressible there): flag matching
+        # class codes and reduce each breach's slice of the CSR index
+        selected_codes = dataclass_vocab.get_indexer(selected_data_classes)
+        hit = np.isin(dc_flat_codes, selected_codes)
+        class_mask = np.add.reduceat(hit, dc_offsets[:-1]) > 0
+        filtered_df = filtered_df[class_mask[filtered_df.index.to_numpy()]]
+
+    # Create a filtered version of data_classes_df based on the current filtered_df
+    filtered_data_classes_df = data_classes_df[data_classes_df['Name'].isin(filtered_df['Name'])]
+    return filtered_df, filtered_data_classes_df
+
+filtered_df, filtered_data_classes_df = compute_filtered(filter_state)
 
 # Main dashboard
 st.markdown('<h1 class="main-header">Data Breach Dashboard</h1>', unsafe_allow_html=True)
@@ -219,129 +384,137 @@ st.markdown('<p style="text-align: center; margin-bottom: 2rem; color: #7f8c8d;"
 st.markdown('<div class="dashboard-metrics">', unsafe_allow_html=True)
 col1, col2, col3, col4 = st.columns(4)
 
+# One markdown write per card instead of four separate protocol messages
 with col1:
-    st.markdown('<div class="card metric-card">', unsafe_allow_html=True)
     total_breaches = len(filtered_df)
-    st.markdown(f'<div class="metric-value">{total_breaches:,}</div>', unsafe_allow_html=True)
-    st.markdown('<div class="metric-label">Total Breaches</div>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+    st.markdown(
+        f'<div class="card metric-card">'
+        f'<div class="metric-value">{total_breaches:,}</div>'
+        f'<div class="metric-label">Total Breaches</div>'
+        f'</div>',
+        unsafe_allow_html=True
+    )
 
 with col2:
-    st.markdown('<div class="card metric-card">', unsafe_allow_html=True)
     total_pwned = filtered_df['PwnCount'].sum()
-    st.markdown(f'<div class="metric-value">{total_pwned:,}</div>', unsafe_allow_html=True)
-    st.markdown('<div class="metric-label">Total Affected Users</div>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+    st.markdown(
+        f'<div class="card metric-card">'
+        f'<div class="metric-value">{total_pwned:,}</div>'
+        f'<div class="metric-label">Total Affected Users</div>'
+        f'</div>',
+        unsafe_allow_html=True
+    )
 
 with col3:
-    st.markdown('<div class="card metric-card">', unsafe_allow_html=True)
     verified_count = filtered_df['IsVerified'].sum()
     verified_percentage = (verified_count / len(filtered_df)) * 100 if len(filtered_df) > 0 else 0
-    st.markdown(f'<div class="metric-value">{verified_count:,} ({verified_percentage:.1f}%)</div>', unsafe_allow_html=True)
-    st.markdown('<div class="metric-label">Verified Breaches</div>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+    st.markdown(
+        f'<div class="card metric-card">'
+        f'<div class="metric-value">{verified_count:,} ({verified_percentage:.1f}%)</div>'
+        f'<div class="metric-label">Verified Breaches</div>'
+        f'</div>',
+        unsafe_allow_html=True
+    )
 
 with col4:
-    st.markdown('<div class="card metric-card">', unsafe_allow_html=True)
     sensitive_count = filtered_df['IsSensitive'].sum()
     sensitive_percentage = (sensitive_count / len(filtered_df)) * 100 if len(filtered_df) > 0 else 0
-    st.markdown(f'<div class="metric-value">{sensitive_count:,} ({sensitive_percentage:.1f}%)</div>', unsafe_allow_html=True)
-    st.markdown('<div class="metric-label">Sensitive Breaches</div>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+    st.markdown(
+        f'<div class="card metric-card">'
+        f'<div class="metric-value">{sensitive_count:,} ({sensitive_percentage:.1f}%)</div>'
+        f'<div class="metric-label">Sensitive Breaches</div>'
+        f'</div>',
+        unsafe_allow_html=True
+    )
 
 st.markdown('</div>', unsafe_allow_html=True)
 
 # 2. Most Common Data Classes Breached
 st.markdown('<h2 class="sub-header">Most Common Data Classes Breached</h2>', unsafe_allow_html=True)
 
-data_class_counts = filtered_data_classes_df['DataClasses'].value_counts().reset_index()
-data_class_counts.columns = ['DataClass', 'Count']
-top_data_classes = data_class_counts.head(10)
-
-# Calculate percentage of breaches for each data class
-top_data_classes = top_data_classes.copy()  # Create a copy to avoid SettingWithCopyWarning
-top_data_classes.loc[:, 'Percentage'] = (top_data_classes['Count'] / top_data_classes['Count'].sum() * 100).round(1)
-top_data_classes.loc[:, 'Label'] = top_data_classes['DataClass'] + ' (' + top_data_classes['Percentage'].astype(str) + '%)'  
-
-# Sort by count in descending order for better visualization
-top_data_classes = top_data_classes.sort_values('Count', ascending=True)
-
-fig_data_classes = px.bar(
-    top_data_classes,
-    x='Count',
-    y='Label',  # Use the new label that includes percentage
-    orientation='h',
-    title='Top 10 Compromised Data Classes',
-    color='Count',
-    color_continuous_scale='Reds',
-    labels={'Count': 'Number of Breaches', 'Label': 'Data Class'},
-    text='Count'  # Display the count on the bars
-)
-
-# Improve the layout
-fig_data_classes.update_traces(textposition='outside')
-fig_data_classes.update_layout(
-    yaxis={'categoryorder':'total ascending'},
-    xaxis_title='Number of Breaches',
-    margin=dict(l=10, r=10, t=40, b=10),
-    plot_bgcolor='rgba(0,0,0,0)',
-    height=500  # Increase height for better readability
-)
+@st.cache_data(show_spinner=False)
+def compute_data_class_counts(state):
+    _, filtered_data_classes_df = compute_filtered(state)
+    data_class_counts = filtered_data_classes_df['DataClasses'].value_counts().reset_index()
+    data_class_counts.columns = ['DataClass', 'Count']
+    top_data_classes = data_class_counts.head(10)
+
+    # Calculate percentage of breaches for each data class
+    top_data_classes = top_data_classes.copy()  # Create a copy to avoid SettingWithCopyWarning
+    top_data_classes.loc[:, 'Percentage'] = (top_data_classes['Count'] / top_data_classes['Count'].sum() * 100).round(1)
+    top_data_classes.loc[:, 'Label'] = top_data_classes['DataClass'].astype(str) + ' (' + top_data_classes['Percentage'].astype(str) + '%)'
+
+    # Sort by count in descending order for better visualization
+    top_data_classes = top_data_classes.sort_values('Count', ascending=True)
+    return data_class_counts, top_data_classes
+
+data_class_counts, top_data_classes = compute_data_class_counts(filter_state)
+
+fig_data_classes = _base_data_classes_fig('Top 10 Compromised Data Classes')
+fig_data_classes.data[0].x = top_data_classes['Count'].values
+fig_data_classes.data[0].y = top_data_classes['Label'].values
+fig_data_classes.data[0].text = top_data_classes['Count'].values
+fig_data_classes.data[0].marker.color = top_data_classes['Count'].values
 st.plotly_chart(fig_data_classes, use_container_width=True)
 
 # 3. Breach Timeline Analysis
 st.markdown('<h2 class="sub-header">Breach Timeline Analysis</h2>', unsafe_allow_html=True)
 
 # Group by year and month
-timeline_data = filtered_df.groupby('BreachYearMonth').agg(
-    BreachCount=('Name', 'count'),
-    TotalAffected=('PwnCount', 'sum')
-).reset_index()
-
-# Sort by date
-timeline_data['BreachYearMonth'] = pd.to_datetime(timeline_data['BreachYearMonth'])
-timeline_data = timeline_data.sort_values('BreachYearMonth')
+@st.cache_data(show_spinner=False)
+def compute_timeline(state):
+    filtered_df, _ = compute_filtered(state)
+
+    # Two bincounts over the dense month codes replace the groupby and
+    # the datetime parsing of the year-month key; months with no breach
+    # are dropped to match the old groupby output
+    codes = filtered_df['MonthCode'].values
+    counts = np.bincount(codes, minlength=len(month_axis))
+    totals = np.bincount(codes, weights=filtered_df['PwnCount'].values,
+                         minlength=len(month_axis))
+    present = np.flatnonzero(counts)
+    return pd.DataFrame({
+        'BreachYearMonth': month_axis[present],
+        'BreachCount': counts[present],
+        'TotalAffected': totals[present].astype(np.int64),
+    })
+
+timeline_data = compute_timeline(filter_state)
 
 # Create two tabs for different timeline views
 tab1, tab2 = st.tabs(["Breach Count Timeline", "Users Affected Timeline"])
 
 with tab1:
-    fig_timeline = px.line(
-        timeline_data,
-        x='BreachYearMonth',
-        y='BreachCount',
-        title='Number of Breaches Over Time',
-        labels={'BreachYearMonth': 'Date', 'BreachCount': 'Number of Breaches'}
-    )
-    fig_timeline.update_traces(line_color='#ff4b4b')
+    fig_timeline = _base_timeline_fig('Number of Breaches Over Time',
+                                      'Number of Breaches', '#ff4b4b')
+    fig_timeline.data[0].x = timeline_data['BreachYearMonth'].values
+    fig_timeline.data[0].y = timeline_data['BreachCount'].values
     st.plotly_chart(fig_timeline, use_container_width=True)
 
 with tab2:
-    fig_affected = px.line(
-        timeline_data,
-        x='BreachYearMonth',
-        y='TotalAffected',
-        title='Number of Users Affected Over Time',
-        labels={'BreachYearMonth': 'Date', 'TotalAffected': 'Number of Users Affected'}
-    )
-    fig_affected.update_traces(line_color='#4b4bff')
+    fig_affected = _base_timeline_fig('Number of Users Affected Over Time',
+                                      'Number of Users Affected', '#4b4bff')
+    fig_affected.data[0].x = timeline_data['BreachYearMonth'].values
+    fig_affected.data[0].y = timeline_data['TotalAffected'].values
     st.plotly_chart(fig_affected, use_container_width=True)
 
 # 4. Most Significant Breaches
 st.markdown('<h2 class="sub-header">Most Significant Breaches</h2>', unsafe_allow_html=True)
 
-top_breaches = filtered_df.nlargest(10, 'PwnCount')
-
-fig_top_breaches = px.bar(
-    top_breaches,
-    x='Name',
-    y='PwnCount',
-    title='Top 10 Breaches by Users Affected',
-    color='PwnCount',
-    color_continuous_scale='Blues',
-    hover_data=['Domain', 'BreachDate', 'IsVerified', 'IsSensitive'],
-    labels={'PwnCount': 'Users Affected', 'Name': 'Breach Name'}
-)
+# Partial partition selects the top 10 in O(N) and sorts only those ten,
+# instead of nlargest sorting the whole filtered frame
+pwn_values = filtered_df['PwnCount'].values
+top_k = min(10, pwn_values.size)
+top_idx = np.argpartition(pwn_values, -top_k)[-top_k:] if top_k else np.empty(0, dtype=int)
+top_idx = top_idx[np.argsort(-pwn_values[top_idx])]
+top_breaches = filtered_df.iloc[top_idx]
+
+fig_top_breaches = _base_top_breaches_fig()
+fig_top_breaches.data[0].x = top_breaches['Name'].values
+fig_top_breaches.data[0].y = top_breaches['PwnCount'].values
+fig_top_breaches.data[0].marker.color = top_breaches['PwnCount'].values
+fig_top_breaches.data[0].customdata = \
+    top_breaches[['Domain', 'BreachDate', 'IsVerified', 'IsSensitive']].values
 st.plotly_chart(fig_top_breaches, use_container_width=True)
 
 # Show details for a selected breach
@@ -392,31 +565,31 @@ with col1:
     verification_counts.columns = ['Status', 'Count']
     verification_counts['Status'] = verification_counts['Status'].map({True: 'Verified', False: 'Unverified'})
     
-    fig_verification = px.pie(
-        verification_counts,
-        values='Count',
-        names='Status',
-        title='Breach Verification Status Distribution',
-        color='Status',
-        color_discrete_map={'Verified': '#4CAF50', 'Unverified': '#FFC107'}
-    )
+    fig_verification = _base_status_pie_fig('Breach Verification Status Distribution')
+    fig_verification.data[0].labels = verification_counts['Status'].values
+    fig_verification.data[0].values = verification_counts['Count'].values
+    fig_verification.data[0].marker.colors = verification_counts['Status'].map(
+        {'Verified': '#4CAF50', 'Unverified': '#FFC107'}).values
     st.plotly_chart(fig_verification, use_container_width=True)
 
 with col2:
-    # Average users affected by verification status
-    verification_impact = filtered_df.groupby('IsVerified')['PwnCount'].mean().reset_index()
-    verification_impact.columns = ['Status', 'Average Users Affected']
-    verification_impact['Status'] = verification_impact['Status'].map({True: 'Verified', False: 'Unverified'})
-    
-    fig_impact = px.bar(
-        verification_impact,
-        x='Status',
-        y='Average Users Affected',
-        title='Average Users Affected by Verification Status',
-        color='Status',
-        color_discrete_map={'Verified': '#4CAF50', 'Unverified': '#FFC107'},
-        labels={'Average Users Affected': 'Average Users Affected', 'Status': 'Verification Status'}
-    )
+    # Average users affected by verification status: two boolean-indexed
+    # means instead of a hashed groupby over just two bins
+    verified_mask = filtered_df['IsVerified'].values
+    pwn_counts = filtered_df['PwnCount'].values
+    verification_impact = pd.DataFrame({
+        'Status': ['Verified', 'Unverified'],
+        'Average Users Affected': [
+            pwn_counts[verified_mask].mean() if verified_mask.any() else 0.0,
+            pwn_counts[~verified_mask].mean() if not verified_mask.all() else 0.0
+        ]
+    })
+
+    fig_impact = _base_impact_bar_fig()
+    fig_impact.data[0].x = verification_impact['Status'].values
+    fig_impact.data[0].y = verification_impact['Average Users Affected'].values
+    fig_impact.data[0].marker.color = verification_impact['Status'].map(
+        {'Verified': '#4CAF50', 'Unverified': '#FFC107'}).values
     st.plotly_chart(fig_impact, use_container_width=True)
 
 # 6. User Impact Analysis
@@ -435,68 +608,51 @@ with impact_tab1:
     size_distribution.loc[:, 'Percentage'] = (size_distribution['Count'] / size_distribution['Count'].sum() * 100).round(1)
     size_distribution.loc[:, 'Label'] = size_distribution['Size Category'].astype(str) + ' (' + size_distribution['Percentage'].astype(str) + '%)'  
     
-    fig_size = px.bar(
-        size_distribution,
-        x='Size Category',
-        y='Count',
-        title='Distribution of Breaches by Size',
-        color='Size Category',
-        color_discrete_sequence=px.colors.qualitative.Set3,
-        labels={'Count': 'Number of Breaches', 'Size Category': 'Breach Size'},
-        text='Percentage'
-    )
-    
-    fig_size.update_traces(texttemplate='%{text}%', textposition='outside')
-    fig_size.update_layout(
-        uniformtext_minsize=10,
-        uniformtext_mode='hide',
-        margin=dict(l=10, r=10, t=40, b=10),
-        plot_bgcolor='rgba(0,0,0,0)'
-    )
+    fig_size = _base_size_fig()
+    fig_size.data[0].x = size_distribution['Size Category'].astype(str).values
+    fig_size.data[0].y = size_distribution['Count'].values
+    fig_size.data[0].text = size_distribution['Percentage'].values
+    fig_size.data[0].marker.color = px.colors.qualitative.Set3[:len(size_distribution)]
+
+# Severity scoring, based on multiple factors:
+# 1. Size of breach (PwnCount)
+# 2. Sensitivity (IsSensitive)
+# 3. Types of data compromised (DataClasses)
+@st.cache_data(show_spinner=False)
+def compute_severity(state):
+    filtered_df, _ = compute_filtered(state)
 
-with impact_tab2:
-    # Create a severity score based on multiple factors
-    # 1. Size of breach (PwnCount)
-    # 2. Sensitivity (IsSensitive)
-    # 3. Types of data compromised (DataClasses)
-    
     # Create a copy to avoid modifying the original dataframe
     severity_df = filtered_df.copy()
-    
-    # Define high-risk data classes
-    high_risk_classes = [
-        'Passwords', 'Credit cards', 'Social security numbers', 'Financial data',
-        'Health records', 'Dates of birth', 'Phone numbers', 'Security questions and answers'
-    ]
-    
-    # Calculate severity score components
-    severity_df['SizeScore'] = pd.cut(
-        severity_df['PwnCount'], 
-        bins=[0, 10000, 1000000, 50000000, float('inf')],
-        labels=[1, 2, 3, 4]
-    ).astype(int)
-    
-    severity_df['SensitiveScore'] = severity_df['IsSensitive'].astype(int) * 3
-    
-    # Calculate data class risk score
-    severity_df['HighRiskDataCount'] = severity_df['DataClasses'].apply(
-        lambda x: sum(1 for item in x if item in high_risk_classes)
-    )
-    severity_df['DataClassScore'] = severity_df['HighRiskDataCount'].apply(lambda x: min(x, 3))
-    
-    # Calculate total severity score (max 10)
-    severity_df['SeverityScore'] = (severity_df['SizeScore'] + 
-                                  severity_df['SensitiveScore'] + 
-                                  severity_df['DataClassScore'])
-    severity_df['SeverityScore'] = severity_df['SeverityScore'].apply(lambda x: min(x, 10))
-    
-    # Create severity categories
-    severity_df['SeverityCategory'] = pd.cut(
-        severity_df['SeverityScore'],
-        bins=[0, 3, 6, 10],
-        labels=['Low', 'Medium', 'High']
+
+    # Score in one fused pass over contiguous arrays: bucket the size via
+    # searchsorted on the bin edges, add the sensitivity weight and the
+    # clamped high-risk class count, then clamp the total at 10
+    pwn = filtered_df['PwnCount'].to_numpy()
+    sens = filtered_df['IsSensitive'].to_numpy()
+    rows = filtered_df.index.to_numpy()
+
+    size_score = np.searchsorted([10000, 1000000, 50000000], pwn, side='left') + 1
+    high_counts = high_risk_per_breach[rows]
+    data_class_score = np.minimum(high_counts, 3)
+    severity_score = np.minimum(size_score + 3 * sens + data_class_score, 10)
+
+    severity_df['SizeScore'] = size_score
+    severity_df['SensitiveScore'] = sens.astype(int) * 3
+    severity_df['HighRiskDataCount'] = high_counts
+    severity_df['DataClassScore'] = data_class_score
+    severity_df['SeverityScore'] = severity_score
+
+    # Severity categories: (0, 3] Low, (3, 6] Medium, (6, 10] High
+    severity_df['SeverityCategory'] = pd.Categorical.from_codes(
+        np.searchsorted([3, 6], severity_score, side='left'),
+        categories=['Low', 'Medium', 'High']
     )
-    
+    return severity_df
+
+with impact_tab2:
+    severity_df = compute_severity(filter_state)
+
     # Display top high severity breaches
     st.subheader("Breach Severity Analysis")
     st.write("Severity is calculated based on breach size, sensitivity, and types of data compromised.")
@@ -505,22 +661,11 @@ with impact_tab2:
     severity_counts = severity_df['SeverityCategory'].value_counts().reset_index()
     severity_counts.columns = ['Severity', 'Count']
     
-    fig_severity = px.pie(
-        severity_counts,
-        values='Count',
-        names='Severity',
-        title='Distribution of Breach Severity',
-        color='Severity',
-        color_discrete_map={'Low': '#2ecc71', 'Medium': '#f39c12', 'High': '#e74c3c'},
-        hole=0.4
-    )
-    
-    fig_severity.update_traces(textposition='inside', textinfo='percent+label')
-    fig_severity.update_layout(
-        margin=dict(l=10, r=10, t=40, b=10),
-        legend=dict(orientation='h', yanchor='bottom', y=-0.2, xanchor='center', x=0.5)
-    )
-    
+    fig_severity = _base_severity_fig()
+    fig_severity.data[0].labels = severity_counts['Severity'].astype(str).values
+    fig_severity.data[0].values = severity_counts['Count'].values
+    fig_severity.data[0].marker.colors = severity_counts['Severity'].astype(str).map(
+        {'Low': '#2ecc71', 'Medium': '#f39c12', 'High': '#e74c3c'}).values
     st.plotly_chart(fig_severity, use_container_width=True)
     
     # Show top high severity breaches
@@ -560,14 +705,11 @@ with col1:
     sensitivity_counts.columns = ['Status', 'Count']
     sensitivity_counts['Status'] = sensitivity_counts['Status'].map({True: 'Sensitive', False: 'Non-Sensitive'})
     
-    fig_sensitivity = px.pie(
-        sensitivity_counts,
-        values='Count',
-        names='Status',
-        title='Breach Sensitivity Status Distribution',
-        color='Status',
-        color_discrete_map={'Sensitive': '#F44336', 'Non-Sensitive': '#2196F3'}
-    )
+    fig_sensitivity = _base_status_pie_fig('Breach Sensitivity Status Distribution')
+    fig_sensitivity.data[0].labels = sensitivity_counts['Status'].values
+    fig_sensitivity.data[0].values = sensitivity_counts['Count'].values
+    fig_sensitivity.data[0].marker.colors = sensitivity_counts['Status'].map(
+        {'Sensitive': '#F44336', 'Non-Sensitive': '#2196F3'}).values
     st.plotly_chart(fig_sensitivity, use_container_width=True)
 
 with col2:
@@ -581,32 +723,16 @@ with col2:
         # Calculate percentage for sensitive data classes
         sensitive_class_counts = sensitive_class_counts.copy()  # Create a copy to avoid SettingWithCopyWarning
         sensitive_class_counts.loc[:, 'Percentage'] = (sensitive_class_counts['Count'] / sensitive_class_counts['Count'].sum() * 100).round(1)
-        sensitive_class_counts.loc[:, 'Label'] = sensitive_class_counts['DataClass'] + ' (' + sensitive_class_counts['Percentage'].astype(str) + '%)'  
+        sensitive_class_counts.loc[:, 'Label'] = sensitive_class_counts['DataClass'].astype(str) + ' (' + sensitive_class_counts['Percentage'].astype(str) + '%)'  
         
         # Sort by count for better visualization
         sensitive_class_counts = sensitive_class_counts.sort_values('Count', ascending=True)
         
-        fig_sensitive_classes = px.bar(
-            sensitive_class_counts,
-            x='Count',
-            y='Label',  # Use the new label that includes percentage
-            orientation='h',
-            title='Top Data Classes in Sensitive Breaches',
-            color='Count',
-            color_continuous_scale='Reds',
-            labels={'Count': 'Number of Breaches', 'Label': 'Data Class'},
-            text='Count'  # Display the count on the bars
-        )
-        
-        # Improve the layout
-        fig_sensitive_classes.update_traces(textposition='outside')
-        fig_sensitive_classes.update_layout(
-            yaxis={'categoryorder':'total ascending'},
-            xaxis_title='Number of Breaches',
-            margin=dict(l=10, r=10, t=40, b=10),
-            plot_bgcolor='rgba(0,0,0,0)',
-            height=500  # Increase height for better readability
-        )
+        fig_sensitive_classes = _base_data_classes_fig('Top Data Classes in Sensitive Breaches')
+        fig_sensitive_classes.data[0].x = sensitive_class_counts['Count'].values
+        fig_sensitive_classes.data[0].y = sensitive_class_counts['Label'].values
+        fig_sensitive_classes.data[0].text = sensitive_class_counts['Count'].values
+        fig_sensitive_classes.data[0].marker.color = sensitive_class_counts['Count'].values
         st.plotly_chart(fig_sensitive_classes, use_container_width=True)
     else:
         st.info("No sensitive breaches in the current filtered dataset.")
@@ -636,18 +762,12 @@ st.dataframe(
 # 9. Geographic Distribution Analysis
 st.markdown('<h2 class="sub-header">Geographic Distribution Analysis</h2>', unsafe_allow_html=True)
 
-# Extract geographic information if available
-geo_data = []
-for _, row in filtered_df.iterrows():
-    if 'Geographic locations' in row['DataClasses']:
-        geo_data.append({
-            'Name': row['Name'],
-            'Domain': row['Domain'],
-            'BreachDate': row['BreachDate'],
-            'PwnCount': row['PwnCount']
-        })
-
-geo_df = pd.DataFrame(geo_data)
+# Extract geographic information if available, using the exploded frame
+# instead of iterating rows and scanning each DataClasses list in Python
+geo_names = filtered_data_classes_df.loc[
+    filtered_data_classes_df['DataClasses'] == 'Geographic locations', 'Name'].unique()
+geo_df = filtered_df.loc[filtered_df['Name'].isin(geo_names),
+                         ['Name', 'Domain', 'BreachDate', 'PwnCount']]
 
 if not geo_df.empty:
     st.write(f"Found {len(geo_df)} breaches with geographic location data")
@@ -683,9 +803,9 @@ st.subheader("Key Insights")
 # Most common data class
 most_common_data_class = data_class_counts.iloc[0]['DataClass'] if not data_class_counts.empty else "N/A"
 
-# Largest breach
-largest_breach = filtered_df.nlargest(1, 'PwnCount')['Name'].iloc[0] if not filtered_df.empty else "N/A"
-largest_breach_count = filtered_df.nlargest(1, 'PwnCount')['PwnCount'].iloc[0] if not filtered_df.empty else 0
+# Largest breach: reuse the top-10 selection, whose first row is the max
+largest_breach = top_breaches['Name'].iloc[0] if not top_breaches.empty else "N/A"
+largest_breach_count = top_breaches['PwnCount'].iloc[0] if not top_breaches.empty else 0
 
 # Recent trend (last 2 years vs previous 2 years)
 current_year = datetime.now().year
@@ -714,26 +834,63 @@ st.markdown('</div>', unsafe_allow_html=True)
 # Search functionality
 st.markdown('<h2 class="sub-header">Search Breaches</h2>', unsafe_allow_html=True)
 
+# Inverted search index, built once: a lowercase trigram -> row id map
+# over name\x01domain plus a lowercase data class -> row id map, so a
+# keystroke looks up candidates instead of regex-scanning every string
+@st.cache_resource
+def build_search_index():
+    corpus = (df['Name'].astype(str).str.lower() + '\x01'
+              + df['Domain'].astype(str).str.lower()).to_numpy().astype(np.str_)
+
+    trigram_rows = {}
+    for row_id, text in enumerate(corpus):
+        for i in range(len(text) - 2):
+            trigram_rows.setdefault(text[i:i + 3], set()).add(row_id)
+    trigram_index = {gram: np.fromiter(sorted(rows), np.int32, len(rows))
+                     for gram, rows in trigram_rows.items()}
+
+    # One breach per df row, so Name resolves a class's breaches to rows
+    name_to_row = pd.Series(np.arange(len(df), dtype=np.int32),
+                            index=df['Name'].astype(str))
+    class_index = {
+        str(data_class).lower(): name_to_row[names.astype(str)].to_numpy()
+        for data_class, names
+        in data_classes_df.groupby('DataClasses', observed=True, sort=False)['Name']
+    }
+    return corpus, trigram_index, class_index
+
 search_term = st.text_input("Search for breaches by name, domain, or data class:")
 
 if search_term:
-    # Search in name, domain, and data classes
-    name_domain_matches = filtered_df[
-        filtered_df['Name'].str.contains(search_term, case=False) | 
-        filtered_df['Domain'].str.contains(search_term, case=False)
-    ]
-    
-    # Search in data classes
-    data_class_matches = data_classes_df[
-        data_classes_df['DataClasses'].str.contains(search_term, case=False)
-    ]
-    
-    # Combine results
-    search_results = pd.concat([
-        name_domain_matches,
-        filtered_df[filtered_df['Name'].isin(data_class_matches['Name'])]
-    ]).drop_duplicates()
-    
+    corpus, trigram_index, class_index = build_search_index()
+    query = search_term.lower()
+
+    # Candidate name/domain rows come from intersecting the query's
+    # trigram posting lists; terms shorter than a trigram scan all rows
+    if len(query) >= 3:
+        candidates = None
+        for i in range(len(query) - 2):
+            rows = trigram_index.get(query[i:i + 3])
+            if rows is None:
+                candidates = np.empty(0, dtype=np.int32)
+                break
+            candidates = rows if candidates is None else \
+                np.intersect1d(candidates, rows, assume_unique=True)
+    else:
+        candidates = np.arange(len(df), dtype=np.int32)
+
+    # Verify the surviving candidates with a plain substring check
+    row_mask = np.zeros(len(df), dtype=bool)
+    if candidates.size:
+        row_mask[candidates[np.char.find(corpus[candidates], query) >= 0]] = True
+
+    # Data class matches resolve to precomputed row id lists
+    for data_class, rows in class_index.items():
+        if query in data_class:
+            row_mask[rows] = True
+
+    search_results = filtered_df[row_mask[filtered_df.index.to_numpy()]]
+
     if not search_results.empty:
         st.write(f"Found {len(search_results)} breaches matching '{search_term}'")
         st.dataframe(
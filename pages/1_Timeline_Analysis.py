@@ -1,9 +1,16 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import json
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
 from datetime import datetime
 
+from utils.data import load_breaches
+
+# Month names built once at import instead of a fresh list per rerun
+_MONTH_NAMES = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+                'August', 'September', 'October', 'November', 'December')
+
 # Set page configuration
 st.set_page_config(
     page_title="Timeline Analysis - Data Breach Dashboard",
@@ -11,34 +18,8 @@ st.set_page_config(
     layout="wide"
 )
 
-# Load data (reusing the same function from Home.py)
-@st.cache_data
-def load_data():
-    with open('breaches.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    df = pd.json_normalize(data)
-    
-    # Convert date columns to datetime
-    df['BreachDate'] = pd.to_datetime(df['BreachDate'])
-    df['AddedDate'] = pd.to_datetime(df['AddedDate'])
-    df['ModifiedDate'] = pd.to_datetime(df['ModifiedDate'])
-    
-    # Extract year and month for timeline analysis
-    df['BreachYear'] = df['BreachDate'].dt.year
-    df['BreachMonth'] = df['BreachDate'].dt.month
-    df['BreachYearMonth'] = df['BreachDate'].dt.strftime('%Y-%m')
-    
-    # Create a column for breach size category
-    df['BreachSizeCategory'] = pd.cut(
-        df['PwnCount'],
-        bins=[0, 10000, 1000000, 50000000, float('inf')],
-        labels=['Small (<10k)', 'Medium (10k-1M)', 'Large (1M-50M)', 'Massive (>50M)']
-    ).astype(str)  # Convert to string type immediately after creation
-    
-    return df
-
-# Load the data
-df = load_data()
+# Load the data (shared cached loader, reused across pages)
+df, _, _ = load_breaches()
 
 # Page title and description
 st.title('📊 Timeline Analysis')
@@ -61,97 +42,158 @@ date_range = st.sidebar.date_input(
     max_value=max_date
 )
 
-if len(date_range) == 2:
-    start_date, end_date = date_range
-    filtered_df = df[(df['BreachDate'].dt.date >= start_date) & 
-                    (df['BreachDate'].dt.date <= end_date)]
-else:
-    filtered_df = df
-
 # Breach size filter
 breach_size = st.sidebar.multiselect(
     "Breach Size",
-    options=df['BreachSizeCategory'].dropna().unique().tolist(),
-    default=df['BreachSizeCategory'].dropna().unique().tolist()
+    options=df['BreachSizeCategory'].cat.categories.tolist(),
+    default=df['BreachSizeCategory'].cat.categories.tolist()
 )
 
-if breach_size:
-    filtered_df = filtered_df[filtered_df['BreachSizeCategory'].isin(breach_size)]
-
-# Create two columns for the visualizations
-col1, col2 = st.columns(2)
-
-with col1:
-    # Yearly trend analysis
-    yearly_breaches = filtered_df.groupby('BreachYear').size().reset_index()
-    yearly_breaches.columns = ['Year', 'Number of Breaches']
-    
-    fig_yearly = px.line(
-        yearly_breaches,
-        x='Year',
-        y='Number of Breaches',
+# The sidebar selection as one hashable tuple; the cached transforms
+# below are keyed on it, so reruns with an unchanged filter state skip
+# the filtering and aggregation work entirely
+filter_state = (tuple(date_range), tuple(breach_size))
+
+@st.cache_data(show_spinner=False)
+def compute_filtered(state):
+    date_range, sizes = state
+    if len(date_range) == 2:
+        start_date, end_date = date_range
+        # df is sorted by BreachDate, so the date range is a
+        # binary-searched slice instead of a boolean scan over every row
+        breach_dates = df['BreachDate'].values.astype('datetime64[D]')
+        lo = np.searchsorted(breach_dates, np.datetime64(start_date), side='left')
+        hi = np.searchsorted(breach_dates, np.datetime64(end_date), side='right')
+        filtered_df = df.iloc[lo:hi]
+    else:
+        filtered_df = df
+    if sizes:
+        filtered_df = filtered_df[filtered_df['BreachSizeCategory'].isin(sizes)]
+    return filtered_df
+
+@st.cache_data(show_spinner=False)
+def compute_yearly(state):
+    # A bincount over the year offsets replaces the hashed groupby
+    years = compute_filtered(state)['BreachYear'].values
+    base_year = int(df['BreachYear'].values.min())
+    year_counts = np.bincount(years - base_year) if years.size else np.zeros(1, dtype=int)
+    observed_years = np.flatnonzero(year_counts)
+    return pd.DataFrame({
+        'Year': observed_years + base_year,
+        'Number of Breaches': year_counts[observed_years],
+    })
+
+@st.cache_data(show_spinner=False)
+def compute_monthly(state):
+    # A bincount over the 1-12 month codes replaces the hashed groupby;
+    # months with no breaches show as zero-height bars
+    months = compute_filtered(state)['BreachMonth'].to_numpy()
+    month_counts = np.bincount(months, minlength=13)[1:]
+    return pd.DataFrame({
+        'Month': np.arange(1, 13),
+        'Number of Breaches': month_counts,
+    })
+
+@st.cache_data(show_spinner=False)
+def compute_size_distribution(state):
+    # observed=True skips materializing empty year/category groups and
+    # sort=False the output sort; rows are already date-ordered
+    return (compute_filtered(state)
+            .groupby(['BreachYear', 'BreachSizeCategory'],
+                     observed=True, sort=False)
+            .size().rename_axis(['Year', 'Size Category'])
+            .reset_index(name='Count'))
+
+# The figure builders cache the serialized figure JSON per filter
+# state, so a repeated selection skips figure construction entirely and
+# reruns only pay for a JSON parse
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def build_yearly_fig(state):
+    yearly_breaches = compute_yearly(state)
+
+    # go.Scatter directly; plotly express re-derives the figure spec from
+    # the frame on every call
+    fig = go.Figure(go.Scatter(
+        x=yearly_breaches['Year'].to_numpy(),
+        y=yearly_breaches['Number of Breaches'].to_numpy(),
+        mode='lines+markers'
+    ))
+    fig.update_layout(
         title='Yearly Trend of Data Breaches',
-        markers=True
-    )
-    fig_yearly.update_layout(
         xaxis_title='Year',
         yaxis_title='Number of Breaches',
         hovermode='x'
     )
-    st.plotly_chart(fig_yearly, use_container_width=True)
-
-with col2:
-    # Monthly distribution
-    monthly_breaches = filtered_df.groupby('BreachMonth').size().reset_index()
-    monthly_breaches.columns = ['Month', 'Number of Breaches']
-    
-    fig_monthly = px.bar(
-        monthly_breaches,
-        x='Month',
-        y='Number of Breaches',
+    return fig.to_json()
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def build_monthly_fig(state):
+    monthly_breaches = compute_monthly(state)
+
+    fig = go.Figure(go.Bar(
+        x=monthly_breaches['Month'].to_numpy(),
+        y=monthly_breaches['Number of Breaches'].to_numpy(),
+        marker=dict(color=monthly_breaches['Number of Breaches'].to_numpy())
+    ))
+    fig.update_layout(
         title='Monthly Distribution of Breaches',
-        color='Number of Breaches'
-    )
-    fig_monthly.update_layout(
         xaxis_title='Month',
         yaxis_title='Number of Breaches',
-        xaxis=dict(tickmode='array', ticktext=['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'],
+        xaxis=dict(tickmode='array',
+                   ticktext=[name[:3] for name in _MONTH_NAMES],
                    tickvals=list(range(1, 13)))
     )
-    st.plotly_chart(fig_monthly, use_container_width=True)
+    return fig.to_json()
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def build_size_dist_fig(state):
+    yearly_size_dist = compute_size_distribution(state)
+
+    fig = go.Figure()
+    for size_category, group in yearly_size_dist.groupby('Size Category', observed=True):
+        fig.add_trace(go.Bar(
+            x=group['Year'].to_numpy(),
+            y=group['Count'].to_numpy(),
+            name=str(size_category)
+        ))
+
+    fig.update_layout(
+        barmode='stack',
+        title='Breach Size Distribution by Year',
+        xaxis_title='Year',
+        yaxis_title='Number of Breaches',
+        legend_title='Breach Size',
+        hovermode='x'
+    )
+    return fig.to_json()
 
-# Breach size distribution over time
-st.subheader('Breach Size Distribution Over Time')
+filtered_df = compute_filtered(filter_state)
 
-# Handle potential missing or invalid categories
-filtered_df['BreachSizeCategory'] = filtered_df['BreachSizeCategory'].astype(str)  # Ensure string type for consistency
+# Create two columns for the visualizations
+col1, col2 = st.columns(2)
 
-# Create the distribution with proper handling of categories
-yearly_size_dist = filtered_df.groupby(['BreachYear', 'BreachSizeCategory']).size().reset_index()
-yearly_size_dist.columns = ['Year', 'Size Category', 'Count']
+with col1:
+    st.plotly_chart(pio.from_json(build_yearly_fig(filter_state)),
+                    use_container_width=True)
 
-fig_size_dist = px.bar(
-    yearly_size_dist,
-    x='Year',
-    y='Count',
-    color='Size Category',
-    title='Breach Size Distribution by Year',
-    barmode='stack'
-)
+with col2:
+    # Monthly distribution
+    st.plotly_chart(pio.from_json(build_monthly_fig(filter_state)),
+                    use_container_width=True)
 
-fig_size_dist.update_layout(
-    xaxis_title='Year',
-    yaxis_title='Number of Breaches',
-    legend_title='Breach Size',
-    hovermode='x'
-)
+# Breach size distribution over time
+st.subheader('Breach Size Distribution Over Time')
 
-st.plotly_chart(fig_size_dist, use_container_width=True)
+st.plotly_chart(pio.from_json(build_size_dist_fig(filter_state)),
+                use_container_width=True)
 
 # Key insights section
 st.subheader('📈 Key Timeline Insights')
 
-# Calculate insights
+# Calculate insights (the cached aggregates are reused, not recomputed)
+yearly_breaches = compute_yearly(filter_state)
+monthly_breaches = compute_monthly(filter_state)
 total_breaches = len(filtered_df)
 yearly_avg = total_breaches / len(yearly_breaches)
 worst_year = yearly_breaches.loc[yearly_breaches['Number of Breaches'].idxmax()]
@@ -171,6 +213,6 @@ with insight_col1:
 with insight_col2:
     st.markdown(f"""
     #### Seasonal Patterns
-    - **Most Common Month**: {['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December'][worst_month['Month']-1]}
+    - **Most Common Month**: {_MONTH_NAMES[int(worst_month['Month']) - 1]}
     - **Peak Monthly Count**: {worst_month['Number of Breaches']:,} breaches
     """)
\ No newline at end of file
@@ -1,8 +1,10 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+import numpy as np
 import plotly.graph_objects as go
-import json
+import plotly.io as pio
+
+from utils.data import load_breaches
 
 # Set page configuration
 st.set_page_config(
@@ -11,30 +13,8 @@ st.set_page_config(
     layout="wide"
 )
 
-# Load data
-@st.cache_data
-def load_data():
-    with open('breaches.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    df = pd.json_normalize(data)
-    
-    # Convert date columns to datetime
-    df['BreachDate'] = pd.to_datetime(df['BreachDate'])
-    
-    # Create a column for breach size category
-    df['BreachSizeCategory'] = pd.cut(
-        df['PwnCount'],
-        bins=[0, 10000, 1000000, 50000000, float('inf')],
-        labels=['Small (<10k)', 'Medium (10k-1M)', 'Large (1M-50M)', 'Massive (>50M)']
-    ).astype(str)  # Convert to string type immediately after creation
-    
-    # Explode the DataClasses column to analyze data types
-    data_classes_df = df.explode('DataClasses')
-    
-    return df, data_classes_df
-
-# Load the data
-df, data_classes_df = load_data()
+# Load the data (shared cached loader, reused across pages)
+df, data_classes_df, combo_strings = load_breaches()
 
 # Page title and description
 st.title('📊 Data Classes Analysis')
@@ -57,101 +37,165 @@ date_range = st.sidebar.date_input(
     max_value=max_date
 )
 
-if len(date_range) == 2:
-    start_date, end_date = date_range
-    filtered_df = df[(df['BreachDate'].dt.date >= start_date) & 
-                    (df['BreachDate'].dt.date <= end_date)]
-else:
-    filtered_df = df
-
-# Create filtered version of data_classes_df
-filtered_data_classes_df = data_classes_df[data_classes_df['Name'].isin(filtered_df['Name'])]
+# The selected date range as a hashable tuple; the cached transforms
+# below are keyed on it, so reruns with an unchanged filter skip the
+# filtering and aggregation work entirely
+filter_state = (tuple(date_range),)
+
+@st.cache_data(show_spinner=False)
+def compute_filtered(state):
+    (date_range,) = state
+    if len(date_range) == 2:
+        start_date, end_date = date_range
+        # Compare the datetime64 values directly; .dt.date would
+        # materialize an object array of date instances first
+        start_ts = pd.Timestamp(start_date).to_datetime64()
+        end_ts = (pd.Timestamp(end_date) + pd.Timedelta(days=1)).to_datetime64()
+        breach_dates = df['BreachDate'].values
+        filtered_df = df[(breach_dates >= start_ts) & (breach_dates < end_ts)]
+    else:
+        filtered_df = df
+
+    # Filter the exploded frame by matching the int32 name codes
+    # instead of hashing the name strings
+    keep_codes = filtered_df['_NameCode'].to_numpy()
+    filtered_data_classes_df = data_classes_df[
+        np.isin(data_classes_df['_NameCode'].to_numpy(), keep_codes)
+    ]
+    return filtered_df, filtered_data_classes_df
+
+@st.cache_data(show_spinner=False)
+def compute_data_class_counts(state):
+    filtered_df, filtered_data_classes_df = compute_filtered(state)
+    data_class_counts = (filtered_data_classes_df['DataClasses'].value_counts()
+                         .rename_axis('Data Class').reset_index(name='Count'))
+    data_class_counts['Percentage'] = (data_class_counts['Count'] / len(filtered_df) * 100).round(1)
+    return data_class_counts
+
+@st.cache_data(show_spinner=False)
+def compute_combinations(state):
+    filtered_df, _ = compute_filtered(state)
+    # Count the int32 combination codes (factorized once in
+    # load_breaches) and resolve only the top codes to display strings
+    data_combinations = filtered_df['ComboCode'].value_counts().head(10)
+    return pd.DataFrame({
+        'Combination': combo_strings[data_combinations.index.to_numpy()],
+        'Count': data_combinations.values
+    })
+
+@st.cache_data(show_spinner=False)
+def compute_temporal(state):
+    _, filtered_data_classes_df = compute_filtered(state)
+    # Chart only the top 10 classes and fold the long tail into "Other";
+    # render time then scales with 11 traces instead of one per class
+    top_classes = compute_data_class_counts(state).head(10)['Data Class']
+    data_classes = filtered_data_classes_df['DataClasses'].where(
+        filtered_data_classes_df['DataClasses'].isin(top_classes), 'Other')
+    temporal_data = (filtered_data_classes_df
+                     .assign(Year=filtered_data_classes_df['BreachDate'].dt.year,
+                             DataClasses=data_classes)
+                     .groupby(['Year', 'DataClasses'], observed=True, sort=False)
+                     .size().rename_axis(['Year', 'Data Class'])
+                     .reset_index(name='Count'))
+    return temporal_data
+
+# The figure builders cache the serialized figure JSON per filter
+# state, so a repeated selection skips figure construction entirely and
+# reruns only pay for a JSON parse
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def build_distribution_fig(state):
+    data_class_counts = compute_data_class_counts(state)
+
+    # go.Bar directly; plotly express re-derives the figure spec from the
+    # frame on every call
+    fig = go.Figure(go.Bar(
+        x=data_class_counts['Data Class'].to_numpy(),
+        y=data_class_counts['Count'].to_numpy(),
+        marker=dict(color=data_class_counts['Count'].to_numpy()),
+        text=data_class_counts['Percentage'].to_numpy(),
+        texttemplate='%{text}%',
+        textposition='outside'
+    ))
+
+    fig.update_layout(
+        title='Frequency of Data Types in Breaches',
+        xaxis_title='Type of Data',
+        yaxis_title='Number of Breaches',
+        xaxis_tickangle=-45,
+        height=600
+    )
+    return fig.to_json()
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def build_combinations_fig(state):
+    data_combinations_df = compute_combinations(state)
+
+    fig = go.Figure(go.Bar(
+        x=data_combinations_df['Count'].to_numpy(),
+        y=data_combinations_df['Combination'].to_numpy(),
+        orientation='h',
+        marker=dict(color=data_combinations_df['Count'].to_numpy())
+    ))
+
+    fig.update_layout(
+        title='Top 10 Most Common Data Class Combinations in Breaches',
+        xaxis_title='Number of Breaches',
+        yaxis_title='Data Classes Combination',
+        height=500,
+        yaxis={'categoryorder':'total ascending'}
+    )
+    return fig.to_json()
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def build_temporal_fig(state):
+    temporal_data = compute_temporal(state)
+
+    fig = go.Figure()
+    for data_class, group in temporal_data.groupby('Data Class', sort=False):
+        fig.add_trace(go.Scatter(
+            x=group['Year'].to_numpy(),
+            y=group['Count'].to_numpy(),
+            mode='lines',
+            name=str(data_class)
+        ))
+
+    fig.update_layout(
+        title='Trends in Compromised Data Types Over Time',
+        xaxis_title='Year',
+        yaxis_title='Number of Breaches',
+        height=500,
+        legend_title='Data Class',
+        hovermode='x unified'
+    )
+    return fig.to_json()
+
+filtered_df, filtered_data_classes_df = compute_filtered(filter_state)
 
 # Data Class Distribution
 st.subheader('Distribution of Compromised Data Types')
 
-data_class_counts = filtered_data_classes_df['DataClasses'].value_counts().reset_index()
-data_class_counts.columns = ['Data Class', 'Count']
-data_class_counts['Percentage'] = (data_class_counts['Count'] / len(filtered_df) * 100).round(1)
-
-fig_distribution = px.bar(
-    data_class_counts,
-    x='Data Class',
-    y='Count',
-    title='Frequency of Data Types in Breaches',
-    color='Count',
-    labels={'Count': 'Number of Breaches', 'Data Class': 'Type of Data'},
-    text='Percentage'
-)
-
-fig_distribution.update_traces(
-    texttemplate='%{text}%',
-    textposition='outside'
-)
-
-fig_distribution.update_layout(
-    xaxis_tickangle=-45,
-    height=600
-)
-
-st.plotly_chart(fig_distribution, use_container_width=True)
+st.plotly_chart(pio.from_json(build_distribution_fig(filter_state)),
+                use_container_width=True)
 
 # Data Class Combinations
 st.subheader('Common Data Class Combinations')
 
-# Create combinations of data classes for each breach
-data_combinations = filtered_df.apply(lambda x: ', '.join(sorted(x['DataClasses'])), axis=1).value_counts().head(10)
-data_combinations_df = pd.DataFrame({
-    'Combination': data_combinations.index,
-    'Count': data_combinations.values
-})
-
-fig_combinations = px.bar(
-    data_combinations_df,
-    x='Count',
-    y='Combination',
-    orientation='h',
-    title='Top 10 Most Common Data Class Combinations in Breaches',
-    color='Count',
-    labels={'Count': 'Number of Breaches', 'Combination': 'Data Classes Combination'}
-)
-
-fig_combinations.update_layout(
-    height=500,
-    yaxis={'categoryorder':'total ascending'}
-)
-
-st.plotly_chart(fig_combinations, use_container_width=True)
+st.plotly_chart(pio.from_json(build_combinations_fig(filter_state)),
+                use_container_width=True)
 
 # Temporal Analysis of Data Classes
 st.subheader('Evolution of Data Classes Over Time')
 
-# Prepare data for temporal analysis
-filtered_data_classes_df['Year'] = filtered_data_classes_df['BreachDate'].dt.year
-temporal_data = filtered_data_classes_df.groupby(['Year', 'DataClasses']).size().reset_index()
-temporal_data.columns = ['Year', 'Data Class', 'Count']
-
-fig_temporal = px.line(
-    temporal_data,
-    x='Year',
-    y='Count',
-    color='Data Class',
-    title='Trends in Compromised Data Types Over Time',
-    labels={'Count': 'Number of Breaches', 'Year': 'Year'}
-)
-
-fig_temporal.update_layout(
-    height=500,
-    legend_title='Data Class',
-    hovermode='x unified'
-)
-
-st.plotly_chart(fig_temporal, use_container_width=True)
+st.plotly_chart(pio.from_json(build_temporal_fig(filter_state)),
+                use_container_width=True)
 
 # Key Insights
 st.subheader('📈 Key Insights')
 
-# Calculate insights
+# Calculate insights (the cached aggregates are reused, not recomputed)
+data_class_counts = compute_data_class_counts(filter_state)
+data_combinations_df = compute_combinations(filter_state)
 total_breaches = len(filtered_df)
 most_common_data = data_class_counts.iloc[0]
 most_common_combo = data_combinations_df.iloc[0]
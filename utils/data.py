@@ -0,0 +1,119 @@
+"""Shared cached data loading for the dashboard pages."""
+
+import os
+
+import numpy as np
+import orjson
+import pandas as pd
+import streamlit as st
+
+
+def _explode_data_classes(df):
+    """Explode DataClasses by repeating rows with np.repeat.
+
+    Equivalent to df.explode('DataClasses') but skips explode's generic
+    multi-column alignment machinery: duplicate each row by its class
+    count, then overwrite the column with the flattened class values.
+    """
+    counts = df['DataClasses'].str.len().values
+    exploded = df.loc[df.index.repeat(counts)]
+    # Arrow-backed strings instead of a PyObject array: contiguous
+    # buffers, C-path hashing for value_counts/isin, and a far smaller
+    # cache entry for the millions of repeated class names
+    flat = pd.array(np.concatenate(df['DataClasses'].values), dtype='string[pyarrow]')
+    return exploded.assign(DataClasses=flat)
+
+
+@st.cache_resource(show_spinner=False)
+def load_breaches():
+    """Load the breach data once and derive the columns every page needs.
+
+    Returns the main breach frame, the exploded frame (one row per
+    breach/data class pair) and the combination string lookup indexed by
+    the ComboCode column. cache_resource hands every page the same
+    in-process objects — unlike cache_data there is no pickle round-trip
+    per rerun, so navigating between pages costs nothing. The pages
+    treat the frames as read-only; derived columns are built here.
+
+    Prefers the typed breaches.parquet written by preprocess_data.py
+    (columnar decode, no JSON parse or datetime conversion) and falls
+    back to parsing breaches.json when the Parquet file is missing or
+    older than the JSON.
+    """
+    if (os.path.exists('breaches.parquet')
+            and os.path.getmtime('breaches.parquet') >= os.path.getmtime('breaches.json')):
+        df = pd.read_parquet('breaches.parquet', engine='pyarrow')
+        # Keep rows sorted by breach date so a date-range filter is a
+        # binary-searched slice rather than a full boolean scan
+        df = df.sort_values('BreachDate', ignore_index=True)
+        # Match the shape the JSON path below produces: the Parquet
+        # stores the year-month as a compact int32 YYYYMM
+        year_month = df['BreachYearMonth'].astype(str)
+        df['BreachYearMonth'] = year_month.str[:4] + '-' + year_month.str[4:]
+        df['DataClassesKey'] = [', '.join(sorted(dc)) for dc in df['DataClasses'].values]
+        combo_codes, combo_strings = pd.factorize(df['DataClassesKey'])
+        df['ComboCode'] = combo_codes.astype(np.int32)
+        df['_NameCode'] = pd.factorize(df['Name'])[0].astype(np.int32)
+        data_classes_df = _explode_data_classes(df)
+        return df, data_classes_df, combo_strings
+
+    # orjson parses the file several times faster than the stdlib parser
+    with open('breaches.json', 'rb') as f:
+        data = orjson.loads(f.read())
+
+    # The breach records are flat, so the plain DataFrame constructor
+    # applies; json_normalize's dict-flattening walk is only needed if
+    # the API ever starts nesting values
+    if data and all(not isinstance(value, dict) for value in data[0].values()):
+        df = pd.DataFrame(data)
+    else:
+        df = pd.json_normalize(data)
+
+    # Convert date columns to datetime; an explicit format keeps pandas
+    # on the single-parser fast path and cache=True dedupes repeats
+    df['BreachDate'] = pd.to_datetime(df['BreachDate'], format='%Y-%m-%d', cache=True)
+    df['AddedDate'] = pd.to_datetime(df['AddedDate'], format='ISO8601', cache=True)
+    df['ModifiedDate'] = pd.to_datetime(df['ModifiedDate'], format='ISO8601', cache=True)
+
+    # Extract year and month for timeline analysis; the narrow dtypes
+    # match what preprocess_data.py bakes into the Parquet
+    df['BreachYear'] = df['BreachDate'].dt.year.astype(np.int16)
+    df['BreachMonth'] = df['BreachDate'].dt.month.astype(np.int8)
+    df['BreachYearMonth'] = df['BreachDate'].dt.strftime('%Y-%m')
+
+    # Create a column for breach size category; kept Categorical so
+    # groupby and isin work on the int8 codes instead of hashing strings
+    df['BreachSizeCategory'] = pd.cut(
+        df['PwnCount'],
+        bins=[0, 10000, 1000000, 50000000, float('inf')],
+        labels=['Small (<10k)', 'Medium (10k-1M)', 'Large (1M-50M)', 'Massive (>50M)']
+    )
+
+    # Dictionary-encode Name to match the dtype preprocess_data.py bakes
+    # into the Parquet, so both load paths hand the pages the same frame
+    df['Name'] = df['Name'].astype('category')
+
+    # Keep rows sorted by breach date so a date-range filter is a
+    # binary-searched slice rather than a full boolean scan
+    df = df.sort_values('BreachDate', ignore_index=True)
+
+    # Canonical sorted combination string per breach, built once here so
+    # the combinations chart is a plain value_counts instead of a
+    # per-row apply on every rerun
+    df['DataClassesKey'] = [', '.join(sorted(dc)) for dc in df['DataClasses'].values]
+
+    # Integer id per distinct combination, so counting combinations runs
+    # over int32 codes; combo_strings maps a code back to its display
+    # string
+    combo_codes, combo_strings = pd.factorize(df['DataClassesKey'])
+    df['ComboCode'] = combo_codes.astype(np.int32)
+
+    # Integer code per breach name; filtering the exploded frame against
+    # a breach selection then matches int32 codes instead of hashing
+    # strings. Added before exploding so both frames share the column
+    df['_NameCode'] = pd.factorize(df['Name'])[0].astype(np.int32)
+
+    # Explode the DataClasses column to analyze data types
+    data_classes_df = _explode_data_classes(df)
+
+    return df, data_classes_df, combo_strings